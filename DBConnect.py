@@ -2,20 +2,120 @@
 # Created: 28.04.2024
 
 # General libraries
-import json
+import importlib
+import importlib.util
+import itertools
 import logging
 import os
 import sys
-import pandas as pd
+import threading
+import uuid
+from urllib.parse import quote
 from enum import Enum
-from cryptography.fernet import Fernet
-# RDBMS libraries
-import oracledb  # Oracle library
-import pymssql  # SQL Server library
-import psycopg2  # PostgreSQL library
-import psycopg2.extras  # PostgreSQL cursors extension
-import MySQLdb  # MySQL library
-import MySQLdb.cursors  # MySQL cursors extension
+from cryptography.fernet import Fernet, InvalidToken
+# use the Rust implementation of Fernet for encrypting/decrypting passwords if available as it is considerably faster
+try:
+    import rfernet
+except ImportError:
+    rfernet = None
+# RDBMS libraries (oracledb, pymssql, psycopg2 and MySQLdb) and pandas are imported on first use, so that only the
+# libraries for the RDBMS types actually in use need to be installed and loaded
+# JSON library (use orjson if available as it is considerably faster than the standard json library)
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+# incremental JSON parser (optional, used to stop reading the config file once the required entry has been found)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+# DataFrame libraries (optional, used by runSqlDF() to build DataFrames directly from columnar results)
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+_HAS_CONNECTORX = importlib.util.find_spec('connectorx') is not None
+
+# default locations of the plaintext and encrypted JSON config files
+_DEFAULT_PLAINTEXT_CONFIG = os.path.abspath(os.path.join('config', 'database-config-plaintext.json'))
+_DEFAULT_CONFIG = os.path.abspath(os.path.join('config', 'database-config.json'))
+# cache of parsed JSON config files, keyed on (config file path, modification time) so that edits are picked up,
+# holding the index of active entries read so far and whether the entire file has been read
+_CONFIG_CACHE = {}
+
+
+class _RustFernet:
+    """
+    Adapter giving rfernet.Fernet the same interface as cryptography's Fernet: tokens and plaintext are passed in and
+    returned as bytes (rfernet uses str for keys and tokens), and invalid tokens raise InvalidToken.
+    """
+
+    __slots__ = ('_fernet',)
+
+    def __init__(self, key):
+        self._fernet = rfernet.Fernet(key.decode('ascii') if isinstance(key, bytes) else key)
+
+    def encrypt(self, data):
+        return self._fernet.encrypt(data).encode('ascii')
+
+    def decrypt(self, token):
+        try:
+            return self._fernet.decrypt(token.decode('ascii') if isinstance(token, bytes) else token)
+        except rfernet.DecryptionError:
+            raise InvalidToken
+
+
+_Fernet = _RustFernet if rfernet is not None else Fernet
+
+
+def _fetchChunks(cursor, chunkSize):
+    """
+    Yields the rows of an executed cursor, fetching them from the database chunkSize rows at a time.
+
+    Parameters:
+        cursor (obj): a cursor of any of the supported RDBMS libraries on which a SQL statement has been executed.
+        chunkSize (int): the number of rows to fetch from the database at a time.
+    """
+    while True:
+        rows = cursor.fetchmany(chunkSize)
+        if not rows:
+            break
+        yield from rows
+
+
+def _toColumns(columns, rows):
+    """
+    Converts a list of rows (tuples or dictionaries) into a columnar layout, i.e. a dictionary of column name to list
+    of values.
+
+    Parameters:
+        columns (list): the names of the columns, in the same order as the values of each row.
+        rows (list): the rows to be converted.
+    Returns:
+        results (dict)
+    """
+    if not rows:
+        return {column: [] for column in columns}
+    if isinstance(rows[0], dict):
+        return {column: [row[column] for row in rows] for column in columns}
+    return {column: list(values) for column, values in zip(columns, zip(*rows))}
+
+
+def _rowsAffected(rowCount, columnar=False):
+    """
+    Formats the number of rows affected by a DML/DDL statement in the requested result layout.
+
+    Parameters:
+        rowCount (int): the number of rows affected.
+        columnar (bool): indicates whether to use the columnar layout (default is False)
+    Returns:
+        results (list or dict)
+    """
+    if columnar:
+        return {'Row(s) affected': [rowCount]}
+    return [{'Row(s) affected': rowCount}]
 
 
 def exceptionHandler(exception_type, exception, traceback):
@@ -45,7 +145,7 @@ def genEncryptionKey():
 
 
 def encryptConfigFile(eKey=os.environ.get('DBCONNECT_ENCRYPT_KEY', 'encryption_key_not_set'), 
-                      configFile=os.path.abspath(os.path.join('config', 'database-config-plaintext.json'))):
+                      configFile=_DEFAULT_PLAINTEXT_CONFIG):
     """
     Reads in the JSON config file and then overwrites it back to file with all passwords encrypted.
 
@@ -53,16 +153,15 @@ def encryptConfigFile(eKey=os.environ.get('DBCONNECT_ENCRYPT_KEY', 'encryption_k
         eKey (str): the Fernet encryption key to be used for encrypting the passwords.
         configFile (str): fully qualified path to the JSON config file.
     """
-    encryptionKey = Fernet(eKey)
-    with open(configFile, 'r') as dbConfigFile:
-        connectionEntries = json.load(dbConfigFile)  # load entire JSON file into nested dictionary
-    dbConfigFile.close()  # close the JSON file
+    encryptionKey = _Fernet(eKey)
+    with open(configFile, 'rb') as dbConfigFile:
+        connectionEntries = _loads(dbConfigFile.read())  # load entire JSON file into nested dictionary
+    encrypt = encryptionKey.encrypt  # bind the method once rather than looking it up for every entry
     for entry in connectionEntries:
-        entry["password"] = encryptionKey.encrypt(entry["password"].encode()).decode('utf-8')
+        entry["password"] = encrypt(entry["password"].encode()).decode('ascii')  # Fernet tokens are always ASCII
     encryptedConfigFile = configFile[:-15] + '.json'
-    with open(encryptedConfigFile, 'w') as dbConfigFile:
-        json.dump(connectionEntries, dbConfigFile, indent=2)
-    dbConfigFile.close()  # close the JSON file
+    with open(encryptedConfigFile, 'wb') as dbConfigFile:
+        dbConfigFile.write(_dumps(connectionEntries))
 
 
 class DBType(Enum):
@@ -88,37 +187,56 @@ class DBConnect:
                           the encryption key generated by genEncryptionKey() and which has been set as the value of the
                           DBCONNECT_ENCRYPT_KEY environment variable.
         activate (bool): Indicates whether to open a connection on instantiation (default is True).
+        pooled (bool): Indicates whether connections are acquired from a connection pool shared by all objects using
+                       the same config file and connection name (default is False). Pooling is supported for Oracle
+                       and PostgreSQL; for other RDBMS types this setting is ignored.
         connDetails (dict): A dictionary of the connection's details read from the JSON config file on creation.
         connection (obj): A child object representing the database connection of the specific RDBMS.
-        lastResult (list): The result of the most recently executed SQL statement, stored as a list of dictionaries.
+        lastResult (list): The result of the most recently executed SQL statement, stored as a list of dictionaries
+                           (or a dictionary of column name to list of values if runSql() was called with
+                           layout='columnar').
         dataFrame (pd.DataFrame): The lastResult converted to a pandas DataFrame.
     """
 
-    sys.excepthook = exceptionHandler
+    # fixed set of instance attributes, avoiding a per-instance __dict__
+    __slots__ = ('name', 'eKey', 'dKey', 'configFile', 'activate', 'pooled', 'connDetails', 'connection', 'lastResult',
+                 'dataFrame', '_plainPassword', '_backend', '_error', '_columnar')
+
+    _pools = {}  # connection pools shared by all pooled objects, keyed on (config file path, connection name)
+    _poolLock = threading.Lock()  # guards creation of the connection pools
 
     def __init__(self, connName, eKey=os.environ.get('DBCONNECT_ENCRYPT_KEY', 'encryption_key_not_set'),
-                 configFile=os.path.abspath(os.path.join('config', 'database-config.json')), activate=True):
+                 configFile=_DEFAULT_CONFIG, activate=True, pooled=False):
         """
         Initialises a DBConnect object with the capability to run SQL statements.
 
         Parameters:
             connName (str): The name of the database connection as defined in the JSON config file.
             eKey (str): The encryption key needed for decrypting passwords in the JSON config file.
+            configFile (str): Fully qualified path to the JSON config file (default is ./config/database-config.json).
             activate (bool): If true (default) the connection will be opened on instantiation.
+            pooled (bool): If true the connection will be acquired from a connection pool (default is False).
         """
         self.name = connName
         self.eKey = eKey
         try:
-            self.dKey = Fernet(eKey)
-        except ValueError as err:
-            logging.error(err)
-            print(f"Encryption key is invalid, please ensure DBCONNECT_ENCRYPT_KEY environment variable has been set!")
+            self.dKey = _Fernet(eKey)
+        except ValueError:
+            logging.exception("Encryption key is invalid, please ensure DBCONNECT_ENCRYPT_KEY environment variable "
+                              "has been set!")
             sys.exit(-1)
         self.configFile = configFile
         self.activate = activate
         self.connDetails = self._getDetails()
+        self._backend = self._BACKENDS.get(self.connDetails['rdbms'])
+        if self._backend is None:
+            raise ValueError(f"Unknown database type {self.connDetails['rdbms']} - cannot establish a connection!")
+        self._error = importlib.import_module(self._backend['driver']).DatabaseError  # also imports the RDBMS library
+        self.pooled = pooled and self._backend['pooling']  # ignore pooling for RDBMS types that do not support it
+        self._plainPassword = self.dKey.decrypt(self.connDetails["password"]).decode()  # decrypt once per object
         self.connection = None  # initialise to NoneType
         self.lastResult = None  # initialise to NoneType
+        self._columnar = False  # indicates whether lastResult is in the columnar layout
         self.dataFrame = None  # initialise to NoneType
         if self.activate:
             self.connect()  # ...then attempt to connect
@@ -130,99 +248,35 @@ class DBConnect:
         Returns:
             self.connection (object)
         """
-        if self.connDetails['rdbms'] == DBType.ORACLE.value:
-            try:
-                self.connection = self._oracleConnection()
-            except oracledb.DatabaseError as err:
-                logging.error(err)
-                print(f"Unexpected error connecting to {self.name}")
-        elif self.connDetails['rdbms'] == DBType.SQL_SERVER.value:
-            try:
-                self.connection = self._sqlServerConnection()
-            except pymssql.DatabaseError as err:
-                logging.error(err)
-                print(f"Unexpected error connecting to {self.name}")
-        elif self.connDetails['rdbms'] == DBType.POSTGRESQL.value:
-            try:
-                self.connection = self._pgConnection()
-            except psycopg2.DatabaseError as err:
-                logging.error(err)
-                print(f"Unexpected error connecting to {self.name}")
-        elif self.connDetails['rdbms'] == DBType.MYSQL.value:
-            try:
-                self.connection = self._mySqlConnection()
-            except MySQLdb.DatabaseError as err:
-                logging.error(err)
-                print(f"Unexpected error connecting to {self.name}")
-        else:
-            raise ValueError(f"Unknown database type {self.connDetails['rdbms']} - cannot establish a connection!")
+        # return any pooled connection already held (e.g. one that has become unhealthy) before acquiring another,
+        # otherwise it would remain checked out of the pool
+        if self.pooled and self.connection is not None:
+            self.disconnect()
+        try:
+            self.connection = self._backend['connect'](self)
+        except self._error:
+            logging.exception("Unexpected error connecting to %s", self.name)
 
     def disconnect(self):
         """
-        Closes an existing open connection object.
-        """
-        if self.status():
-            if self.connDetails['rdbms'] == DBType.ORACLE.value:
-                try:
-                    self.connection.close()
-                except oracledb.DatabaseError as err:
-                    logging.error(err)
-                    print(f"Unexpected error disconnecting from {self.name}")
-            elif self.connDetails['rdbms'] == DBType.SQL_SERVER.value:
-                try:
-                    self.connection.close()
-                except pymssql.DatabaseError as err:
-                    logging.error(err)
-                    print(f"Unexpected error disconnecting from {self.name}")
-            elif self.connDetails['rdbms'] == DBType.POSTGRESQL.value:
-                try:
-                    self.connection.close()
-                except psycopg2.DatabaseError as err:
-                    logging.error(err)
-                    print(f"Unexpected error disconnecting from {self.name}")
-            elif self.connDetails['rdbms'] == DBType.MYSQL.value:
-                try:
-                    self.connection.close()
-                except MySQLdb.DatabaseError as err:
-                    logging.error(err)
-                    print(f"Unexpected error disconnecting from {self.name}")
-            else:
-                raise ValueError(f"Unknown database type {self.connDetails['rdbms']} - cannot establish a connection!")
+        Closes an existing open connection object, or releases a pooled connection back to its pool.
+        """
+        # pooled connections are always released, even if unhealthy, so they are not left checked out of the pool
+        if (self.pooled and self.connection is not None) or self.status():
+            try:
+                self._backend['disconnect'](self)
+            except self._error:
+                logging.exception("Unexpected error disconnecting from %s", self.name)
 
     def status(self):
         """
         Indicates whether a connection is open (True) or closed (False).
         """
-        status = False
         if self.connection is None:
-            status = False
-        elif self.connDetails['rdbms'] == DBType.ORACLE.value:
-            try:
-                if self.connection.is_healthy():
-                    status = True
-                else:
-                    status = False
-            except oracledb.DatabaseError as err:
-                logging.error(err)
-                print(f"Unexpected error connecting to {self.name}")
-        elif self.connDetails['rdbms'] == DBType.SQL_SERVER.value:
-            try:
-                status = self.connection._conn.connected
-            except pymssql.InterfaceError:
-                status = False
-        elif self.connDetails['rdbms'] == DBType.POSTGRESQL.value:
-            if self.connection.closed:
-                status = False
-            else:
-                status = True
-        elif self.connDetails['rdbms'] == DBType.MYSQL.value:
-            if self.connection.open == 1:
-                status = True
-            else:
-                status = False
-        return status
+            return False
+        return self._backend['status'](self)
 
-    def runSql(self, sql="", one=False, commit=False, kill=True):
+    def runSql(self, sql="", one=False, commit=False, kill=None, chunkSize=None, layout='rows'):
         """
         Executes a SQL statement using the child connection object and returns the results.
         
@@ -230,98 +284,121 @@ class DBConnect:
             sql (str): the SQL statement to be executed.
             one (bool): indicates whether to return only the first row (default is False)
             commit (bool): indicates whether to execute a COMMIT after executing (default is False)
-            kill (bool): indicates whether to close the connection after executing (default is True)
+            kill (bool): indicates whether to close the connection (or release it back to the connection pool) after
+                         executing (default is True, or False for pooled connections)
+            chunkSize (int): if set, fetch the rows from the database this many at a time rather than all at once
+                             (default is None). The full result set is still built and returned, so use iterSql()
+                             to reduce memory use. For PostgreSQL this uses a server-side cursor, so is only
+                             suitable for SELECT statements.
+            layout (str): 'rows' (default) to return a list of dictionaries, one per row, or 'columnar' to return a
+                          dictionary of column name to list of values, which is more compact for large result sets
+                          and faster to convert to a DataFrame.
         Returns:
-            results (list)
+            results (list or dict)
         """
-        results = []  # initialise to empty list
+        if layout not in ('rows', 'columnar'):
+            raise ValueError(f"Unknown result layout {layout} - must be 'rows' or 'columnar'!")
+        columnar = layout == 'columnar'
+        if kill is None:
+            kill = not self.pooled
         # check if connection open, and if not, establish it
-        self.status()
         if not self.status():
             self.connect()
         # based on the RDBMS type, carry out the SQL execution
-        # Oracle
-        if self.connDetails['rdbms'] == DBType.ORACLE.value:
-            cur = self.connection.cursor()
-            try:
-                cur.execute(sql)
-                if cur.description is None:
-                    results = [{'Row(s) affected': cur.rowcount}]
-                else:
-                    columns = [col[0] for col in cur.description]
-                    cur.rowfactory = lambda *args: dict(zip(columns, args))
-                    results = cur.fetchall()
-                if commit:
-                    self.connection.commit()
-                if kill:
-                    self.disconnect()
-            except oracledb.DatabaseError as err:
-                logging.error(err)
-                raise oracledb.DatabaseError(f"Unable to execute SQL statement using Oracle connection {self.name}")
-        # SQL Server
-        elif self.connDetails['rdbms'] == DBType.SQL_SERVER.value:
-            cur = self.connection.cursor(as_dict=True)
-            try:
-                cur.execute(sql)
-                # try to get rows, if exception then assume DML/DDL and return how many rows were affected
-                try:
-                    results = cur.fetchall()
-                except pymssql.OperationalError:
-                    results = [{'Row(s) affected': cur.rowcount}]
-                if commit:
-                    self.connection.commit()
-                if kill:
-                    self.disconnect()
-            except pymssql.DatabaseError as err:
-                logging.error(err)
-                raise pymssql.DatabaseError(f"Unable to execute SQL statement using SQL Server connection {self.name}")
-        # PostgreSQL
-        elif self.connDetails['rdbms'] == DBType.POSTGRESQL.value:
-            cur = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            try:
-                cur.execute(sql)
-                # check if the cursor selected any rows (e.g. if it's an INSERT then there won't be any rows to fetch)
-                if cur.statusmessage[0:6] == 'SELECT' and cur.rowcount > 0:
-                    rawResults = cur.fetchall()
-                    keys = [i.keys() for i in rawResults]
-                    values = [i.values() for i in rawResults]
-                    for i in range(len(rawResults)):
-                        d = dict(zip(keys[i], values[i]))
-                        results.append(d)
-                else:
-                    results = [{'Row(s) affected': cur.rowcount}]
-                if commit:
-                    self.connection.commit()
-                if kill:
-                    self.disconnect()
-            except psycopg2.DatabaseError as err:
-                logging.error(err)
-                raise psycopg2.DatabaseError(f"Unable to execute SQL statement using PostgreSQL connection {self.name}")
-        # MySQL
-        elif self.connDetails['rdbms'] == DBType.MYSQL.value:
-            try:
-                cur = self.connection.cursor()
-                rowCount = cur.execute(sql)
-                results = cur.fetchall()
-                results = [i for i in results]  # convert to list for consistency
-                # if no rows were returned, assume it was DML/DDL
-                if len(results) == 0:
-                    results = [{'Row(s) affected': rowCount}]
-                if commit:
-                    self.connection.commit()
-                if kill:
-                    self.disconnect()
-            except MySQLdb.DatabaseError as err:
-                logging.error(err)
-                raise MySQLdb.DatabaseError(f"Unable to execute SQL statement using MySQL connection {self.name}")
-        else:
-            ValueError(f"Unknown database type {self.connDetails['rdbms']} - cannot execute SQL statement!")
+        try:
+            if chunkSize is None:
+                results = self._backend['execute'](self, sql, columnar)
+            else:
+                columns = []
+                results = list(self._backend['stream'](self, sql, chunkSize, columns))
+                if columnar:
+                    # DML/DDL statements report no columns, so fall back to the keys of the rows affected dictionary
+                    results = _toColumns(columns or (list(results[0]) if results else []), results)
+            if commit:
+                self.connection.commit()
+            if kill:
+                self.disconnect()
+        except self._error as err:
+            logging.error(err)
+            raise self._error(f"Unable to execute SQL statement using {self._backend['label']} "
+                              f"connection {self.name}")
         # set lastResults value and return the results
         if one:
-            results = results[0]
+            results = {column: values[:1] for column, values in results.items()} if columnar else results[0]
+        self.lastResult = results
+        self._columnar = columnar
+        return results
+
+    def runMany(self, sql="", rows=(), pageSize=1000, commit=False, kill=None):
+        """
+        Executes a SQL statement (typically an INSERT) for many rows in as few round-trips as possible, which is much
+        faster than calling runSql() once per row. Bind parameters use the style of the underlying RDBMS library,
+        except for PostgreSQL where the statement must contain a single %s placeholder for the VALUES list.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            rows (list): a list of tuples (or dictionaries for named parameters) with the values for each row.
+            pageSize (int): the number of rows to send per statement for PostgreSQL (default is 1000)
+            commit (bool): indicates whether to execute a COMMIT after executing (default is False)
+            kill (bool): indicates whether to close the connection (or release it back to the connection pool) after
+                         executing (default is True, or False for pooled connections)
+        Returns:
+            results (list)
+        """
+        if kill is None:
+            kill = not self.pooled
+        # check if connection open, and if not, establish it
+        if not self.status():
+            self.connect()
+        try:
+            results = self._backend['executemany'](self, sql, rows, pageSize)
+            if commit:
+                self.connection.commit()
+            if kill:
+                self.disconnect()
+        except self._error as err:
+            logging.error(err)
+            raise self._error(f"Unable to execute SQL statement using {self._backend['label']} "
+                              f"connection {self.name}")
         self.lastResult = results
+        self._columnar = False
         return results
 
+    def iterSql(self, sql="", chunkSize=1000, commit=False, kill=None):
+        """
+        Executes a SQL statement using the child connection object and yields the results one row at a time,
+        fetching them from the database in chunks so the full result set is never held in memory.
+        Unlike runSql(), the results are not stored in the lastResult attribute.
+        For PostgreSQL this uses a server-side cursor, so is only suitable for SELECT statements.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            chunkSize (int): the number of rows to fetch from the database at a time (default is 1000)
+            commit (bool): indicates whether to execute a COMMIT after all rows have been fetched (default is False)
+            kill (bool): indicates whether to close the connection (or release it back to the connection pool) once
+                         iteration ends, including if the caller stops early (default is True, or False for pooled
+                         connections)
+        Yields:
+            row (dict)
+        """
+        if kill is None:
+            kill = not self.pooled
+        # check if connection open, and if not, establish it
+        if not self.status():
+            self.connect()
+        try:
+            yield from self._backend['stream'](self, sql, chunkSize)
+            if commit:
+                self.connection.commit()
+        except self._error as err:
+            logging.error(err)
+            raise self._error(f"Unable to execute SQL statement using {self._backend['label']} "
+                              f"connection {self.name}")
+        finally:
+            # also runs if the caller stops iterating early, so the connection is not left open (or checked out)
+            if kill:
+                self.disconnect()
+
     def flush(self):
         """
         Clears the lastResult and dataFrame attributes.
@@ -336,12 +413,47 @@ class DBConnect:
         Returns:
             self.dataFrame (pd.DataFrame): a pandas DataFrame of the most recently executed SQL statement.
         """
+        import pandas as pd
         if self.lastResult is not None:
-            self.dataFrame = pd.DataFrame.from_records(self.lastResult)
+            if self._columnar:
+                self.dataFrame = pd.DataFrame(self.lastResult, copy=False)
+            else:
+                self.dataFrame = pd.DataFrame.from_records(self.lastResult)
             return self.dataFrame
         else:
             raise ValueError("Cannot create DataFrame, no SQL statement has been executed by this object.")
 
+    def runSqlDF(self, sql="", kill=None):
+        """
+        Executes a SQL SELECT statement and returns the results as a pandas DataFrame.
+        Where possible (Oracle with pyarrow installed, or PostgreSQL with connectorx installed) the DataFrame is built
+        directly from a columnar result, skipping the list of dictionaries produced by runSql(), in which case the
+        lastResult attribute is not updated. Otherwise this is equivalent to calling runSql() then makeDataFrame().
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            kill (bool): indicates whether to close the connection (or release it back to the connection pool) after
+                         executing (default is True, or False for pooled connections)
+        Returns:
+            self.dataFrame (pd.DataFrame): a pandas DataFrame of the results of the SQL statement.
+        """
+        if kill is None:
+            kill = not self.pooled
+        dataFrame = None
+        if self._backend['dataframe'] is not None:
+            try:
+                dataFrame = self._backend['dataframe'](self, sql, kill)
+            except self._error as err:
+                logging.error(err)
+                raise self._error(f"Unable to execute SQL statement using {self._backend['label']} "
+                                  f"connection {self.name}")
+        # fall back to building the DataFrame from the list of dictionaries if the columnar path is unavailable
+        if dataFrame is None:
+            self.runSql(sql, kill=kill)
+            return self.makeDataFrame()
+        self.dataFrame = dataFrame
+        return self.dataFrame
+
     def _oracleConnection(self):
         """
         Creates a child Oracle connection object.
@@ -349,6 +461,7 @@ class DBConnect:
         Returns:
             oracledb.connect()
         """
+        import oracledb
         if "dsn" in self.connDetails:
             dsn = self.connDetails["dsn"]
         else:
@@ -356,12 +469,22 @@ class DBConnect:
         try:
             # establish Oracle connection
             oracledb.defaults.fetch_lobs = False  # this allows DBConnect class to read <1GB CLOB data as a string
+            if self.pooled:
+                poolKey = (self.configFile, self.name)
+                with self._poolLock:
+                    if poolKey not in self._pools:
+                        # wait at most 20 seconds for a free connection rather than blocking indefinitely
+                        self._pools[poolKey] = oracledb.create_pool(user=self.connDetails["username"],
+                                                                    password=self._plainPassword,
+                                                                    dsn=dsn, min=2, max=10, increment=1,
+                                                                    getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                                                                    wait_timeout=20000)
+                return self._pools[poolKey].acquire()
             return oracledb.connect(user=self.connDetails["username"],
-                                    password=self.dKey.decrypt(self.connDetails["password"]).decode(),
+                                    password=self._plainPassword,
                                     dsn=dsn)
-        except oracledb.DatabaseError as err:
-            logging.error(err)
-            print(f"Could not establish Oracle connection for {self.name}")
+        except oracledb.DatabaseError:
+            logging.exception("Could not establish Oracle connection for %s", self.name)
 
     def _sqlServerConnection(self):
         """
@@ -370,15 +493,15 @@ class DBConnect:
         Returns:
             pymssql.connect()
         """
+        import pymssql
         try:
             # establish MSSQL connection
             return pymssql.connect(self.connDetails["server"],
                                    self.connDetails["username"],
-                                   self.dKey.decrypt(self.connDetails["password"]).decode(),
+                                   self._plainPassword,
                                    self.connDetails["database-name"])
-        except pymssql.DatabaseError as err:
-            logging.exception(err)
-            print(f"Could not establish SQL Server connection for {self.name}")
+        except pymssql.DatabaseError:
+            logging.exception("Could not establish SQL Server connection for %s", self.name)
 
     def _pgConnection(self):
         """
@@ -387,15 +510,27 @@ class DBConnect:
         Returns:
             psycopg2.connect()
         """
+        import psycopg2
+        import psycopg2.pool
         try:
             # establish PostgreSQL connection
+            if self.pooled:
+                poolKey = (self.configFile, self.name)
+                with self._poolLock:
+                    if poolKey not in self._pools:
+                        self._pools[poolKey] = psycopg2.pool.ThreadedConnectionPool(
+                            2, 10,
+                            host=self.connDetails["server"],
+                            database=self.connDetails["database-name"],
+                            user=self.connDetails["username"],
+                            password=self._plainPassword)
+                return self._pools[poolKey].getconn()
             return psycopg2.connect(host=self.connDetails["server"],
                                     database=self.connDetails["database-name"],
                                     user=self.connDetails["username"],
-                                    password=self.dKey.decrypt(self.connDetails["password"]).decode())
-        except psycopg2.DatabaseError as err:
-            logging.exception(err)
-            print(f"Could not establish PostgreSQL connection for {self.name}")
+                                    password=self._plainPassword)
+        except (psycopg2.DatabaseError, psycopg2.pool.PoolError):  # PoolError is raised if the pool is exhausted
+            logging.exception("Could not establish PostgreSQL connection for %s", self.name)
 
     def _mySqlConnection(self):
         """
@@ -404,18 +539,425 @@ class DBConnect:
         Returns:
             MySQLdb.connect()
         """
+        import MySQLdb
         try:
             # establish MySQL connection
             return MySQLdb.Connection(host=self.connDetails["server"],
                                       db=self.connDetails["database-name"],
                                       user=self.connDetails["username"],
-                                      passwd=self.dKey.decrypt(self.connDetails["password"]).decode(),
+                                      passwd=self._plainPassword,
                                       port=int(self.connDetails["port"]),
                                       connect_timeout=20,
-                                      cursorclass=MySQLdb.cursors.DictCursor)
-        except MySQLdb.DatabaseError as err:
-            logging.exception(err)
-            print(f"Could not establish MySQL connection for {self.name}")
+                                      cursorclass=self._mySqlCursorClass())
+        except MySQLdb.DatabaseError:
+            logging.exception("Could not establish MySQL connection for %s", self.name)
+
+    def _mySqlCursorClass(self):
+        """
+        Determines the MySQL cursor class to use: a server-side streaming cursor if "streaming" is set to true for the
+        connection in the JSON config file, otherwise the default client-side buffered cursor.
+
+        Returns:
+            MySQLdb.cursors.SSDictCursor or MySQLdb.cursors.DictCursor
+        """
+        import MySQLdb.cursors
+        if self.connDetails.get("streaming", False):
+            return MySQLdb.cursors.SSDictCursor
+        return MySQLdb.cursors.DictCursor
+
+    def _closeConnection(self):
+        """
+        Closes the child connection object (common to all RDBMS types).
+        """
+        self.connection.close()
+
+    def _oracleDisconnect(self):
+        """
+        Closes the child Oracle connection object, or releases it back to the connection pool if pooled (dropping it
+        from the pool instead if it is no longer healthy).
+        """
+        if self.pooled:
+            pool = self._pools[(self.configFile, self.name)]
+            if self.status():
+                pool.release(self.connection)
+            else:
+                pool.drop(self.connection)
+            self.connection = None
+        else:
+            self.connection.close()
+
+    def _pgDisconnect(self):
+        """
+        Closes the child PostgreSQL connection object, or returns it to the connection pool if pooled (closing it
+        instead if it is no longer open).
+        """
+        if self.pooled:
+            self._pools[(self.configFile, self.name)].putconn(self.connection, close=not self.status())
+            self.connection = None
+        else:
+            self.connection.close()
+
+    def _oracleStatus(self):
+        """
+        Indicates whether the child Oracle connection object is open (True) or closed (False).
+        """
+        import oracledb
+        try:
+            return self.connection.is_healthy()
+        except oracledb.DatabaseError:
+            logging.exception("Unexpected error connecting to %s", self.name)
+            return False
+
+    def _sqlServerStatus(self):
+        """
+        Indicates whether the child SQL Server connection object is open (True) or closed (False).
+        """
+        import pymssql
+        try:
+            return self.connection._conn.connected
+        except pymssql.InterfaceError:
+            return False
+
+    def _pgStatus(self):
+        """
+        Indicates whether the child PostgreSQL connection object is open (True) or closed (False).
+        """
+        return not self.connection.closed
+
+    def _mySqlStatus(self):
+        """
+        Indicates whether the child MySQL connection object is open (True) or closed (False).
+        """
+        return self.connection.open == 1
+
+    def _oracleExecute(self, sql, columnar=False):
+        """
+        Executes a SQL statement using the child Oracle connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            columnar (bool): indicates whether to return the results as a dictionary of columns (default is False)
+        Returns:
+            results (list or dict)
+        """
+        cur = self.connection.cursor()
+        cur.execute(sql)
+        if cur.description is None:
+            return _rowsAffected(cur.rowcount, columnar)
+        if columnar:
+            return _toColumns([col[0] for col in cur.description], cur.fetchall())
+        # build the dictionaries as the tuples are fetched, rather than calling a rowfactory per row, iterating the
+        # cursor so only one chunk of tuples is held in memory at a time
+        columns = tuple(col[0] for col in cur.description)
+        return [dict(zip(columns, row)) for row in cur]
+
+    def _sqlServerExecute(self, sql, columnar=False):
+        """
+        Executes a SQL statement using the child SQL Server connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            columnar (bool): indicates whether to return the results as a dictionary of columns (default is False)
+        Returns:
+            results (list or dict)
+        """
+        import pymssql
+        cur = self.connection.cursor(as_dict=not columnar)
+        cur.execute(sql)
+        # try to get rows, if exception then assume DML/DDL and return how many rows were affected
+        try:
+            rows = cur.fetchall()
+        except pymssql.OperationalError:
+            return _rowsAffected(cur.rowcount, columnar)
+        return _toColumns([col[0] for col in cur.description], rows) if columnar else rows
+
+    def _pgExecute(self, sql, columnar=False):
+        """
+        Executes a SQL statement using the child PostgreSQL connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            columnar (bool): indicates whether to return the results as a dictionary of columns (default is False)
+        Returns:
+            results (list or dict)
+        """
+        import psycopg2.extras
+        if columnar:
+            cur = self.connection.cursor()  # plain cursor returns tuples, which are cheaper to transpose
+        else:
+            cur = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        cur.execute(sql)
+        # check if the cursor selected any rows (e.g. if it's an INSERT then there won't be any rows to fetch)
+        if cur.statusmessage[0:6] == 'SELECT' and cur.rowcount > 0:
+            if columnar:
+                return _toColumns([col[0] for col in cur.description], cur.fetchall())
+            return [dict(row) for row in cur.fetchall()]  # convert RealDictRow objects to plain dicts
+        return _rowsAffected(cur.rowcount, columnar)
+
+    def _mySqlExecute(self, sql, columnar=False):
+        """
+        Executes a SQL statement using the child MySQL connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            columnar (bool): indicates whether to return the results as a dictionary of columns (default is False)
+        Returns:
+            results (list or dict)
+        """
+        import MySQLdb.cursors
+        streaming = self.connDetails.get("streaming", False)
+        if columnar:
+            # tuple cursors are cheaper to transpose than the default dictionary cursors
+            cur = self.connection.cursor(MySQLdb.cursors.SSCursor if streaming else MySQLdb.cursors.Cursor)
+        else:
+            cur = self.connection.cursor()
+        rowCount = cur.execute(sql)
+        if streaming:
+            # streaming cursors read rows from the server as they are iterated, rather than buffering them on execute
+            results = list(cur) if cur.description is not None else []
+        else:
+            results = list(cur.fetchall())  # MySQLdb returns a tuple, convert to list for consistency
+        # if no rows were returned, assume it was DML/DDL
+        if len(results) == 0:
+            return _rowsAffected(rowCount, columnar)
+        return _toColumns([col[0] for col in cur.description], results) if columnar else results
+
+    def _oracleExecuteMany(self, sql, rows, pageSize):
+        """
+        Executes a SQL statement once for each set of bind values using the child Oracle connection object.
+        Rows which fail are logged rather than aborting the whole batch.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            rows (list): the bind values for each execution.
+            pageSize (int): unused, as oracledb sends all rows in a single round-trip.
+        Returns:
+            results (list)
+        """
+        cur = self.connection.cursor()
+        cur.executemany(sql, rows, batcherrors=True)
+        for error in cur.getbatcherrors():
+            logging.error("Row %s failed for %s: %s", error.offset, self.name, error.message)
+        return _rowsAffected(cur.rowcount)
+
+    def _sqlServerExecuteMany(self, sql, rows, pageSize):
+        """
+        Executes a SQL statement once for each set of parameters using the child SQL Server connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            rows (list): the parameters for each execution.
+            pageSize (int): unused by pymssql.
+        Returns:
+            results (list)
+        """
+        cur = self.connection.cursor()
+        cur.executemany(sql, rows)
+        return _rowsAffected(cur.rowcount)
+
+    def _pgExecuteMany(self, sql, rows, pageSize):
+        """
+        Executes a SQL statement for a list of rows using the child PostgreSQL connection object, sending pageSize
+        rows per statement. The SQL statement must contain a single %s placeholder for the VALUES list.
+
+        Parameters:
+            sql (str): the SQL statement to be executed, e.g. INSERT INTO mytable (col_a, col_b) VALUES %s
+            rows (iterable): the values for each row (any iterable, e.g. a generator).
+            pageSize (int): the number of rows to send per statement.
+        Returns:
+            results (list)
+        """
+        import psycopg2.extras
+        cur = self.connection.cursor()
+        # send one page at a time so iterators are consumed lazily, adding up the row count of each page
+        # (after execute_values() with many pages, cur.rowcount only reflects the final page)
+        rows = iter(rows)
+        rowCount = 0
+        while True:
+            page = list(itertools.islice(rows, pageSize))
+            if not page:
+                break
+            psycopg2.extras.execute_values(cur, sql, page, page_size=pageSize)
+            rowCount += cur.rowcount
+        return _rowsAffected(rowCount)
+
+    def _mySqlExecuteMany(self, sql, rows, pageSize):
+        """
+        Executes a SQL statement once for each set of parameters using the child MySQL connection object.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            rows (list): the parameters for each execution.
+            pageSize (int): unused by MySQLdb.
+        Returns:
+            results (list)
+        """
+        cur = self.connection.cursor()
+        rowCount = cur.executemany(sql, rows)
+        return _rowsAffected(rowCount or 0)  # MySQLdb returns None when there are no rows to execute
+
+    def _oracleStream(self, sql, chunkSize, columns=None):
+        """
+        Executes a SQL statement using the child Oracle connection object and yields the rows in chunks.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            chunkSize (int): the number of rows to fetch from the database at a time.
+            columns (list): if given, filled with the column names of the result set (default is None)
+        Yields:
+            row (dict)
+        """
+        cur = self.connection.cursor()
+        cur.arraysize = chunkSize
+        try:
+            cur.execute(sql)
+            if cur.description is None:
+                yield {'Row(s) affected': cur.rowcount}
+            else:
+                names = tuple(col[0] for col in cur.description)
+                if columns is not None:
+                    columns.extend(names)
+                for row in _fetchChunks(cur, chunkSize):
+                    yield dict(zip(names, row))
+        finally:
+            cur.close()
+
+    def _sqlServerStream(self, sql, chunkSize, columns=None):
+        """
+        Executes a SQL statement using the child SQL Server connection object and yields the rows in chunks.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            chunkSize (int): the number of rows to fetch from the database at a time.
+            columns (list): if given, filled with the column names of the result set (default is None)
+        Yields:
+            row (dict)
+        """
+        import pymssql
+        cur = self.connection.cursor(as_dict=True)
+        try:
+            cur.execute(sql)
+            # try to get rows, if exception then assume DML/DDL and return how many rows were affected
+            try:
+                rows = cur.fetchmany(chunkSize)
+            except pymssql.OperationalError:
+                yield {'Row(s) affected': cur.rowcount}
+                return
+            if columns is not None:
+                columns.extend(col[0] for col in cur.description)
+            yield from rows
+            yield from _fetchChunks(cur, chunkSize)
+        finally:
+            cur.close()
+
+    def _pgStream(self, sql, chunkSize, columns=None):
+        """
+        Executes a SQL SELECT statement using a server-side cursor on the child PostgreSQL connection object and
+        yields the rows in chunks. Note that server-side cursors can only be used for SELECT statements.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            chunkSize (int): the number of rows to fetch from the database at a time.
+            columns (list): if given, filled with the column names of the result set (default is None)
+        Yields:
+            row (dict)
+        """
+        import psycopg2.extras
+        # server-side cursors need a unique name so that overlapping calls on the same connection do not clash
+        cur = self.connection.cursor(name=f'dbconnect_{uuid.uuid4().hex}',
+                                     cursor_factory=psycopg2.extras.RealDictCursor)
+        cur.itersize = chunkSize
+        try:
+            cur.execute(sql)
+            empty = True
+            for row in _fetchChunks(cur, chunkSize):
+                if empty and columns is not None:
+                    columns.extend(col[0] for col in cur.description)  # only set once the first chunk is fetched
+                empty = False
+                yield dict(row)  # convert RealDictRow objects to plain dicts
+            # match _pgExecute(), which reports a SELECT returning no rows as 0 rows affected
+            if empty:
+                yield {'Row(s) affected': 0}
+        finally:
+            cur.close()
+
+    def _mySqlStream(self, sql, chunkSize, columns=None):
+        """
+        Executes a SQL statement using a server-side streaming cursor on the child MySQL connection object, regardless
+        of the "streaming" setting, and yields the rows in chunks.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            chunkSize (int): the number of rows to fetch from the database at a time.
+            columns (list): if given, filled with the column names of the result set (default is None)
+        Yields:
+            row (dict)
+        """
+        import MySQLdb.cursors
+        cur = self.connection.cursor(MySQLdb.cursors.SSDictCursor)
+        try:
+            rowCount = cur.execute(sql)
+            # if no result set was produced, assume it was DML/DDL
+            if cur.description is None:
+                yield {'Row(s) affected': rowCount}
+            else:
+                empty = True
+                for row in _fetchChunks(cur, chunkSize):
+                    if empty and columns is not None:
+                        columns.extend(col[0] for col in cur.description)
+                    empty = False
+                    yield row
+                # match _mySqlExecute(), which reports a SELECT returning no rows as 0 rows affected
+                if empty:
+                    yield {'Row(s) affected': 0}
+        finally:
+            cur.close()
+
+    def _oracleDataFrame(self, sql, kill):
+        """
+        Executes a SQL SELECT statement using the child Oracle connection object and builds a pandas DataFrame
+        directly from the columnar (Arrow) result, without creating a Python object per row.
+        This requires pyarrow and python-oracledb 3.0 or later.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            kill (bool): indicates whether to close the connection after executing.
+        Returns:
+            dataFrame (pd.DataFrame): or None if pyarrow or python-oracledb 3.0 or later is not installed.
+        """
+        import oracledb
+        if not _HAS_PYARROW or not hasattr(oracledb.Connection, 'fetch_df_all'):
+            return None
+        import pyarrow
+        if not self.status():
+            self.connect()
+        oracleDataFrame = self.connection.fetch_df_all(statement=sql)
+        if kill:
+            self.disconnect()
+        return pyarrow.table(oracleDataFrame).to_pandas()
+
+    def _pgDataFrame(self, sql, kill):
+        """
+        Executes a SQL SELECT statement against the PostgreSQL database using connectorx, which builds a pandas
+        DataFrame directly from the columnar result. Note that connectorx manages its own connection to the database.
+
+        Parameters:
+            sql (str): the SQL statement to be executed.
+            kill (bool): indicates whether to close this object's own connection after executing (connectorx always
+                         closes the connection it uses).
+        Returns:
+            dataFrame (pd.DataFrame): or None if connectorx is not installed.
+        """
+        if not _HAS_CONNECTORX:
+            return None
+        import connectorx
+        # no port is given, matching _pgConnection(), so both connect to the same server on the default port
+        uri = (f"postgresql://{quote(self.connDetails['username'], safe='')}:{quote(self._plainPassword, safe='')}"
+               f"@{self.connDetails['server']}/{self.connDetails['database-name']}")
+        dataFrame = connectorx.read_sql(uri, sql, return_type='pandas')
+        if kill:
+            self.disconnect()
+        return dataFrame
 
     def _getDetails(self):
         """
@@ -424,14 +966,93 @@ class DBConnect:
         Returns:
             entry (dict)
         """
-        configFile = os.path.abspath(os.path.join('config', 'database-config.json'))
-        with open(configFile, 'r') as dbConfigFile:
-            connectionEntries = json.load(dbConfigFile)  # load entire JSON file into nested dictionary
-        dbConfigFile.close()  # close the JSON file
-        for entry in connectionEntries:
-            if entry["active"] and entry["connection-name"] == self.name:
-                return entry
+        configFile = self.configFile
+        cacheKey = (configFile, os.path.getmtime(configFile))
+        activeEntries, complete = _CONFIG_CACHE.get(cacheKey, ({}, False))
+        if self.name not in activeEntries and not complete:
+            complete = self._scanConfigFile(configFile, activeEntries)
+            if cacheKey not in _CONFIG_CACHE:
+                # the config file is new or has changed, so discard any cached versions of it
+                for staleKey in [key for key in _CONFIG_CACHE if key[0] == configFile]:
+                    del _CONFIG_CACHE[staleKey]
+            _CONFIG_CACHE[cacheKey] = (activeEntries, complete)
+        entry = activeEntries.get(self.name)
+        if entry is not None:
+            return dict(entry)  # return a copy so the cached entry cannot be modified via this object
         raise ValueError(f"Unable to find active connection {self.name} in JSON config file")
 
+    def _scanConfigFile(self, configFile, activeEntries):
+        """
+        Reads the JSON config file into activeEntries, an index of the active entries by connection name (keeping the
+        first entry seen for each name). If ijson is installed the file is parsed incrementally and reading stops as
+        soon as the entry for this connection is found, otherwise the entire file is parsed.
+
+        Parameters:
+            configFile (str): fully qualified path to the JSON config file.
+            activeEntries (dict): the index of active entries to be added to.
+        Returns:
+            complete (bool): True if the entire file was read.
+        """
+        with open(configFile, 'rb') as dbConfigFile:
+            if ijson is not None:
+                # stream the entries one at a time, returning non-integer numbers as floats as json does
+                connectionEntries = ijson.items(dbConfigFile, 'item', use_float=True)
+            else:
+                connectionEntries = _loads(dbConfigFile.read())  # load entire JSON file into nested dictionary
+            for entry in connectionEntries:
+                if entry["active"] and entry["connection-name"] not in activeEntries:
+                    # store the token in the type the selected Fernet decrypts natively: rfernet takes str tokens
+                    # as read from the file, while cryptography's Fernet takes bytes
+                    if _Fernet is Fernet:
+                        entry["password"] = entry["password"].encode('ascii')
+                    activeEntries[entry["connection-name"]] = entry
+                    if ijson is not None and entry["connection-name"] == self.name:
+                        return False
+        return True
+
+    # dispatch table of RDBMS-specific functions, resolved once per object on instantiation
+    _BACKENDS = {
+        DBType.ORACLE.value: {'label': 'Oracle',
+                              'pooling': True,
+                              'connect': _oracleConnection,
+                              'disconnect': _oracleDisconnect,
+                              'status': _oracleStatus,
+                              'execute': _oracleExecute,
+                              'executemany': _oracleExecuteMany,
+                              'stream': _oracleStream,
+                              'dataframe': _oracleDataFrame,
+                              'driver': 'oracledb'},
+        DBType.SQL_SERVER.value: {'label': 'SQL Server',
+                                  'pooling': False,
+                                  'connect': _sqlServerConnection,
+                                  'disconnect': _closeConnection,
+                                  'status': _sqlServerStatus,
+                                  'execute': _sqlServerExecute,
+                                  'executemany': _sqlServerExecuteMany,
+                                  'stream': _sqlServerStream,
+                                  'dataframe': None,
+                                  'driver': 'pymssql'},
+        DBType.POSTGRESQL.value: {'label': 'PostgreSQL',
+                                  'pooling': True,
+                                  'connect': _pgConnection,
+                                  'disconnect': _pgDisconnect,
+                                  'status': _pgStatus,
+                                  'execute': _pgExecute,
+                                  'executemany': _pgExecuteMany,
+                                  'stream': _pgStream,
+                                  'dataframe': _pgDataFrame,
+                                  'driver': 'psycopg2'},
+        DBType.MYSQL.value: {'label': 'MySQL',
+                             'pooling': False,
+                             'connect': _mySqlConnection,
+                             'disconnect': _closeConnection,
+                             'status': _mySqlStatus,
+                             'execute': _mySqlExecute,
+                             'executemany': _mySqlExecuteMany,
+                             'stream': _mySqlStream,
+                             'dataframe': None,
+                             'driver': 'MySQLdb'}
+    }
+
 
 sys.excepthook = exceptionHandler